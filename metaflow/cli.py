@@ -15,10 +15,9 @@ from . import namespace
 from . import current
 from .cli_args import cli_args
 from .util import resolve_identity, decompress_list, write_latest_run_id, \
-    get_latest_run_id, to_unicode
+    get_latest_run_id, to_unicode, cached_property
 from .task import MetaflowTask
 from .exception import CommandException, MetaflowException
-from .graph import FlowGraph
 from .datastore import DATASTORES
 from .runtime import NativeRuntime
 from .package import MetaflowPackage
@@ -733,8 +732,9 @@ def before_run(obj, tags, decospecs):
     # in two places in this module and we need to make sure that
     # _init_step_decorators doesn't get called twice.
     if decospecs:
+        # graph nodes share the decorator lists of the step functions, so
+        # the graph sees the new decorators without being rebuilt.
         decorators._attach_decorators(obj.flow, decospecs)
-        obj.graph = FlowGraph(obj.flow.__class__)
     obj.check(obj.graph, obj.flow, obj.environment, pylint=obj.pylint)
     #obj.environment.init_environment(obj.logger)
 
@@ -833,15 +833,15 @@ def start(ctx,
         echo = echo_dev_null
     else:
         echo = echo_always
+        # the banner is the only thing here that needs the version, which
+        # may shell out to git, so skip it for quiet (e.g. task) invocations
+        version = ctx.obj.version
+        if use_r():
+            version = metaflow_r_version()
 
-    ctx.obj.version = metaflow_version.get_version()
-    version = ctx.obj.version
-    if use_r():
-        version = metaflow_r_version()
-
-    echo('Metaflow %s' % version, fg='magenta', bold=True, nl=False)
-    echo(" executing *%s*" % ctx.obj.flow.name, fg='magenta', nl=False)
-    echo(" for *%s*" % resolve_identity(), fg='magenta')
+        echo('Metaflow %s' % version, fg='magenta', bold=True, nl=False)
+        echo(" executing *%s*" % ctx.obj.flow.name, fg='magenta', nl=False)
+        echo(" for *%s*" % resolve_identity(), fg='magenta')
 
     if coverage:
         from coverage import Coverage
@@ -854,7 +854,9 @@ def start(ctx,
     cli_args._set_top_kwargs(ctx.params)
     ctx.obj.echo = echo
     ctx.obj.echo_always = echo_always
-    ctx.obj.graph = FlowGraph(ctx.obj.flow.__class__)
+    # FlowSpec.__init__ has already parsed the flow source into a graph;
+    # reuse it instead of running inspect.getsource and ast.parse again.
+    ctx.obj.graph = ctx.obj.flow._graph
     ctx.obj.logger = logger
     ctx.obj.check = _check
     ctx.obj.pylint = pylint
@@ -923,11 +925,11 @@ def _reconstruct_cli(params):
         if v:
             if k == 'decospecs':
                 k = 'with'
-            k = k.replace('_', '-')
+            opt = '--' + k.replace('_', '-')
             if not isinstance(v, tuple):
-                v = [v]
+                v = (v,)
             for value in v:
-                yield '--%s' % k
+                yield opt
                 if not isinstance(value, bool):
                     yield str(value)
 
@@ -988,6 +990,10 @@ class CliState(object):
     def __init__(self, flow):
         self.flow = flow
 
+    @cached_property
+    def version(self):
+        return metaflow_version.get_version()
+
 def main(flow, args=None, handle_exceptions=True, entrypoint=None):
     # Ignore warning(s) and prevent spamming the end-user.
     # TODO: This serves as a short term workaround for RuntimeWarning(s) thrown
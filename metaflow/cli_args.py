@@ -47,11 +47,9 @@ class CLIArgs(object):
         if step_kwargs is None:
             step_kwargs = self._step_kwargs
 
-        top_args_list = list(self._options(top_kwargs))
-        cmd.extend(top_args_list)
+        cmd.extend(self._options(top_kwargs))
         cmd.extend(['step', step_name])
-        step_args_list = list(self._options(step_kwargs))
-        cmd.extend(step_args_list)
+        cmd.extend(self._options(step_kwargs))
 
         return cmd
 
@@ -63,10 +61,10 @@ class CLIArgs(object):
                 # keyword in Python, so we call it 'decospecs' in click args
                 if k == 'decospecs':
                     k = 'with'
-                k = k.replace('_', '-')
-                v = v if isinstance(v, (list, tuple, set)) else [v]
+                opt = '--' + k.replace('_', '-')
+                v = v if isinstance(v, (list, tuple, set)) else (v,)
                 for value in v:
-                    yield '--%s' % k
+                    yield opt
                     if not isinstance(value, bool):
                         yield to_unicode(value)
 
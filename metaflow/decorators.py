@@ -155,6 +155,10 @@ class FlowDecorator(Decorator):
 
 # compare this to parameters.add_custom_parameters
 def add_decorator_options(cmd):
+    # options are inserted in place, so applying this twice to the same
+    # command would register every decorator option a second time
+    if getattr(cmd, '_metaflow_decorator_options', False):
+        return cmd
     seen = {}
     for deco in flow_decorators():
         for option, kwargs in deco.options.items():
@@ -167,6 +171,7 @@ def add_decorator_options(cmd):
             else:
                 seen[option] = deco.name
                 cmd.params.insert(0, click.Option(('--' + option,), **kwargs))
+    cmd._metaflow_decorator_options = True
     return cmd
 
 
@@ -411,14 +416,28 @@ def _attach_decorators(flow, decospecs):
     for step in flow:
         _attach_decorators_to_step(step, decospecs)
 
+_step_decorator_types = None
+
+def _get_step_decorator_types():
+    """
+    Return a mapping from decorator name to StepDecorator class. The set of
+    step decorators is fixed once plugins are loaded, so the mapping is
+    built only once instead of for every step we attach decorators to.
+    """
+    global _step_decorator_types
+    if _step_decorator_types is None:
+        from .plugins import STEP_DECORATORS
+        _step_decorator_types = {decotype.name: decotype
+                                 for decotype in STEP_DECORATORS}
+    return _step_decorator_types
+
 def _attach_decorators_to_step(step, decospecs):
     """
     Attach decorators to a step during runtime. This has the same
     effect as if you defined the decorators statically in the source for
     the step.
     """
-    from .plugins import STEP_DECORATORS
-    decos = {decotype.name: decotype for decotype in STEP_DECORATORS}
+    decos = _get_step_decorator_types()
     for decospec in decospecs:
         deconame = decospec.strip("'").split(':')[0]
         if deconame not in decos:
@@ -47,6 +47,7 @@ class FlowSpec(object):
                   '_cached_input',
                   '_graph',
                   '_flow_decorators',
+                  '_parameter_names',
                   '_steps',
                   'index',
                   'input'}
@@ -94,9 +95,25 @@ class FlowSpec(object):
         return os.path.basename(fname)
 
     def _get_parameters(self):
-        for var in dir(self):
-            if var[0] == '_':
-                continue
+        cls = self.__class__
+        # Parameters are class attributes, so find their names once per flow
+        # class instead of calling getattr on every attribute of every
+        # instance. The cache lives in the class' own __dict__ so that it is
+        # not inherited by subclasses of the flow.
+        names = cls.__dict__.get('_parameter_names')
+        if names is None:
+            names = []
+            for var in dir(cls):
+                if var[0] == '_':
+                    continue
+                try:
+                    val = getattr(cls, var)
+                except:
+                    continue
+                if isinstance(val, Parameter):
+                    names.append(var)
+            cls._parameter_names = names
+        for var in names:
             try:
                 val = getattr(self, var)
             except:
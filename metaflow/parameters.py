@@ -50,6 +50,14 @@ class JSONTypeClass(click.ParamType):
     def __repr__(self):
         return 'JSON'
 
+# types that _check_type can validate for deploy-time values.
+# note: this doesn't work with long in Python2 or types defined as
+# click types, e.g. click.INT
+_DEPLOY_TIME_TYPES = {bool: 'bool',
+                      int: 'int',
+                      float: 'float',
+                      list: 'list'}
+
 class DeployTimeField(object):
     """
     This a wrapper object for a user-defined function that is called
@@ -97,28 +105,22 @@ class DeployTimeField(object):
         # in Parameter. Let's catch those mistakes early here, instead of
         # showing a cryptic stack trace later.
 
-        # note: this doesn't work with long in Python2 or types defined as
-        # click types, e.g. click.INT
-        TYPES = {bool: 'bool',
-                 int: 'int',
-                 float: 'float',
-                 list: 'list'}
-
-        msg = "The value returned by the deploy-time function for "\
-              "the parameter *%s* field *%s* has a wrong type. " %\
-              (self.parameter_name, self.field)
-
-        if self.parameter_type in TYPES:
+        if self.parameter_type in _DEPLOY_TIME_TYPES:
             if type(val) != self.parameter_type:
-                msg += 'Expected a %s.' % TYPES[self.parameter_type]
-                raise ParameterFieldTypeMismatch(msg)
+                raise ParameterFieldTypeMismatch(self._type_mismatch_msg(
+                    _DEPLOY_TIME_TYPES[self.parameter_type]))
             return str(val) if self.return_str else val
         else:
             if not is_stringish(val):
-                msg += 'Expected a string.'
-                raise ParameterFieldTypeMismatch(msg)
+                raise ParameterFieldTypeMismatch(
+                    self._type_mismatch_msg('string'))
             return val
 
+    def _type_mismatch_msg(self, expected):
+        return "The value returned by the deploy-time function for "\
+               "the parameter *%s* field *%s* has a wrong type. "\
+               "Expected a %s." % (self.parameter_name, self.field, expected)
+
     @property
     def description(self):
         return self.print_representation
@@ -152,6 +154,8 @@ def set_parameter_context(flow_name, echo, datastore):
 class Parameter(object):
     def __init__(self, name, **kwargs):
         self.name = name
+        # click delivers --my-param as the keyword argument my_param
+        self.kwarg_name = name.replace('-', '_').lower()
         self.kwargs = kwargs
         # TODO: check that the type is one of the supported types
         param_type = self.kwargs['type'] = self._get_type(kwargs)
@@ -230,17 +234,24 @@ def add_custom_parameters(deploy_mode=False):
     # deploy_mode determines whether deploy-time functions should or should
     # not be evaluated for this command
     def wrapper(cmd):
-        # Iterate over parameters in reverse order so cmd.params lists options
-        # in the order they are defined in the FlowSpec subclass
-        for arg in parameters[::-1]:
-            kwargs = arg.option_kwargs(deploy_mode)
-            cmd.params.insert(0, click.Option(('--' + arg.name,), **kwargs))
+        # cmd.params is modified in place, so make sure we add the
+        # parameters only once even if the wrapper is applied again
+        if getattr(cmd, '_metaflow_custom_parameters', False):
+            return cmd
+        # Prepend all options in one splice so cmd.params lists them in the
+        # order they are defined in the FlowSpec subclass
+        cmd.params[:0] = [click.Option(('--' + arg.name,),
+                                       **arg.option_kwargs(deploy_mode))
+                          for arg in parameters]
+        cmd._metaflow_custom_parameters = True
         return cmd
     return wrapper
 
 def set_parameters(flow, kwargs):
+    # _get_parameters walks dir(flow) on every call, so do it only once
+    params = list(flow._get_parameters())
     seen = set()
-    for var, param in flow._get_parameters():
+    for var, param in params:
         norm = param.name.lower()
         if norm in seen:
             raise MetaflowException("Parameter *%s* is specified twice. "
@@ -249,8 +260,8 @@ def set_parameters(flow, kwargs):
         seen.add(norm)
 
     flow._success = True
-    for var, param in flow._get_parameters():
-        val = kwargs[param.name.replace('-', '_').lower()]
+    for var, param in params:
+        val = kwargs[param.kwarg_name]
         # Support for delayed evaluation of parameters. This is used for
         # includefile in particular
         if callable(val):
@@ -148,8 +148,11 @@ class StepFunctions(object):
             raise StepFunctionsException("The workflow *%s* doesn't exist "
                                          "on AWS Step Functions. Please "
                                          "deploy your flow first." % name)
-        # Dump parameters into `Parameters` input field.
-        input = json.dumps({"Parameters" : json.dumps(parameters)})
+        # Dump parameters into `Parameters` input field. Use compact
+        # separators since the input size is capped below.
+        input = json.dumps({"Parameters" : json.dumps(parameters,
+                                                      separators=(',', ':'))},
+                           separators=(',', ':'))
         # AWS Step Functions limits input to be 32KiB, but AWS Batch
         # has it's own limitation of 30KiB for job specification length.
         # Reserving 10KiB for rest of the job sprecification leaves 20KiB
@@ -355,14 +355,14 @@ def resolve_token(name,
 @click.pass_obj
 def trigger(obj, run_id_file=None, **kwargs):
     def _convert_value(param):
-        # Swap `-` with `_` in parameter name to match click's behavior
-        val = kwargs.get(param.name.replace('-', '_').lower())
-        return json.dumps(val) if param.kwargs.get('type') == JSONType else \
+        val = kwargs.get(param.kwarg_name)
+        return json.dumps(val, separators=(',', ':')) \
+            if param.kwargs.get('type') == JSONType else \
             val() if callable(val) else val
 
     params = {param.name: _convert_value(param)
               for _, param in obj.flow._get_parameters()
-                if kwargs.get(param.name.replace('-', '_').lower()) is not None}
+                if kwargs.get(param.kwarg_name) is not None}
 
     response = StepFunctions.trigger(obj.state_machine_name, params)
 
@@ -873,10 +873,10 @@ class CLIArgs(object):
                     # keyword in Python, so we call it 'decospecs' in click args
                     if k == 'decospecs':
                         k = 'with'
-                    k = k.replace('_', '-')
-                    v = v if isinstance(v, (list, tuple, set)) else [v]
+                    opt = '--' + k.replace('_', '-')
+                    v = v if isinstance(v, (list, tuple, set)) else (v,)
                     for value in v:
-                        yield '--%s' % k
+                        yield opt
                         if not isinstance(value, bool):
                             yield to_unicode(value)
 
@@ -7,6 +7,8 @@ class MessageTypes(object):
     SHUTDOWN, LOG_EVENT = range(1, 3)
 
 class Message(object):
+    # one Message is created per logged event, so keep them small
+    __slots__ = ('msg_type', 'payload')
 
     def __init__(self, msg_type, payload):
         self.msg_type = msg_type
@@ -122,7 +122,7 @@ def is_stringish(x):
     """
     Returns true if the object is a unicode or a bytes object
     """
-    return isinstance(x, bytes_type) or isinstance(x, unicode_type)
+    return isinstance(x, (bytes_type, unicode_type))
 
 
 def to_fileobj(x):